@@ -2,19 +2,45 @@
 
 Uses structlog with stdlib logging as the backend. Two formats:
 - console: human-readable for development (default)
-- json: structured for production
+- json: structured for production (serialized with orjson when installed)
 """
 
 from __future__ import annotations
 
+import json
 import logging
 import os
+from typing import Any
 
 import structlog
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 _configured = False
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSONRenderer serializer backed by orjson.
+
+    ProcessorFormatter needs ``str``, so orjson's bytes are decoded. Only the
+    ``default`` fallback is forwarded — orjson has no stdlib-style options.
+    Events orjson rejects (e.g., ints beyond 64 bits) are rendered with the
+    stdlib instead, so a log line is never lost to the faster serializer.
+    """
+    try:
+        rendered: str = orjson.dumps(
+            obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except TypeError:
+        return json.dumps(obj, **kwargs)
+    return rendered
+
+
 def configure_logging(
     log_format: str | None = None,
     level: str | None = None,
@@ -41,7 +67,11 @@ def configure_logging(
     ]
 
     if resolved_format == "json":
-        renderer: structlog.types.Processor = structlog.processors.JSONRenderer()
+        renderer: structlog.types.Processor = (
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+            if HAS_ORJSON
+            else structlog.processors.JSONRenderer()
+        )
     else:
         renderer = structlog.dev.ConsoleRenderer()
 
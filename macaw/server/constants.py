@@ -19,10 +19,15 @@ ALLOWED_AUDIO_CONTENT_TYPES = frozenset(
     }
 )
 
-# gRPC channel options for TTS workers (30MB max message size)
+# gRPC channel options for TTS workers (30MB max message size). Keepalive
+# matches the scheduler's channels and stays above the worker's 5s minimum
+# ping interval, so cached idle channels are never closed for ping abuse.
 TTS_GRPC_CHANNEL_OPTIONS = [
     ("grpc.max_send_message_length", 30 * 1024 * 1024),
     ("grpc.max_receive_message_length", 30 * 1024 * 1024),
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
 ]
 
 # Timeout for the gRPC Synthesize call (seconds)
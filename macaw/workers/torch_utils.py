@@ -3,10 +3,14 @@
 These utilities must be called at specific points in the worker lifecycle:
 - configure_cuda_env(): BEFORE any ``import torch`` (module-level)
 - configure_torch_inference(): AFTER torch is available (inside serve())
+- configure_jit_executor(): BEFORE any TorchScript module runs (inside serve())
+- configure_torch_threads(): BEFORE the first inference op (inside serve())
+- configure_compile_cache(): BEFORE the first torch.compile (inside backend load())
 """
 
 from __future__ import annotations
 
+import hashlib
 import os
 
 from macaw.logging import get_logger
@@ -56,6 +60,146 @@ def configure_torch_inference() -> None:
         pass
 
 
+def configure_jit_executor() -> bool:
+    """Disable the TorchScript profiling executor and graph optimizations.
+
+    The profiling executor records shapes on the first runs of a scripted
+    module and re-optimizes on a later run with the same inputs, so a
+    one-pass warmup leaves a recompile on the first real request. Disabling
+    it runs scripted modules with the legacy executor.
+
+    Opt-in via ``MACAW_DISABLE_JIT_PROFILING=1``: the switches are private and
+    process-wide, and no in-tree engine runs TorchScript (Kokoro and Qwen3 are
+    eager), so it only matters for engines that ship scripted modules. Safe to
+    call even if torch is not installed.
+
+    Returns:
+        True if the profiling executor was disabled, False otherwise.
+    """
+    if os.environ.get("MACAW_DISABLE_JIT_PROFILING", "0").lower() not in ("1", "true", "yes"):
+        return False
+    try:
+        import torch
+    except ImportError:
+        return False
+
+    # Private torch._C hooks; not every torch build exposes all of them.
+    for name, value in (
+        ("_jit_set_profiling_executor", False),
+        ("_jit_set_profiling_mode", False),
+        ("_get_graph_executor_optimize", False),
+    ):
+        setter = getattr(torch._C, name, None)
+        if callable(setter):
+            setter(value)
+
+    logger.info("jit_profiling_executor_disabled")
+    return True
+
+
+def configure_torch_threads(num_threads: int) -> None:
+    """Size PyTorch's intra-op CPU thread pool.
+
+    Used when inference threads are pinned to a subset of cores, so that
+    torch does not spawn one thread per visible core and oversubscribe them.
+    Safe to call even if torch is not installed.
+    """
+    try:
+        import torch
+
+        torch.set_num_threads(num_threads)
+        logger.info("torch_threads_configured", num_threads=num_threads)
+    except ImportError:
+        pass
+
+
+_DEFAULT_COMPILE_CACHE_DIR = "~/.cache/macaw"
+
+
+def configure_compile_cache(engine: str, model_path: str, device: str) -> str | None:
+    """Point TorchInductor and Triton caches at a persistent per-model directory.
+
+    Without a stable cache dir, every worker restart pays full Inductor codegen
+    and Triton autotuning again. The cache is keyed by
+    ``engine|model_path|torch version|device capability`` so artifacts are
+    never shared across incompatible builds or GPUs. The FX graph cache is
+    enabled so compiled graphs are reused across processes (dynamo tracing
+    and guards are not, which is why warmup still runs on every boot).
+
+    Base directory comes from ``MACAW_COMPILE_CACHE_DIR`` (default
+    ``~/.cache/macaw``). Env vars already set by the operator are respected.
+    Only call it for models that are actually compiled, before the first
+    ``torch.compile``.
+
+    Args:
+        engine: Engine name (e.g., "kokoro").
+        model_path: Path to the model files.
+        device: Resolved device the model runs on ("cpu", "cuda", "cuda:N").
+            Only CUDA devices are probed for their capability.
+
+    Returns:
+        The cache key, or None if torch is not installed.
+    """
+    try:
+        import torch
+    except ImportError:
+        return None
+
+    capability = (
+        "{}.{}".format(*torch.cuda.get_device_capability(device))
+        if device.startswith("cuda")
+        else "cpu"
+    )
+    fingerprint = f"{engine}|{model_path}|{torch.__version__}|{capability}"
+    key = hashlib.sha256(fingerprint.encode()).hexdigest()[:16]
+
+    base_dir = os.path.expanduser(
+        os.environ.get("MACAW_COMPILE_CACHE_DIR", _DEFAULT_COMPILE_CACHE_DIR)
+    )
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", os.path.join(base_dir, "inductor", key))
+    os.environ.setdefault("TRITON_CACHE_DIR", os.path.join(base_dir, "triton", key))
+    os.environ.setdefault("TORCHINDUCTOR_FX_GRAPH_CACHE", "1")
+
+    logger.info(
+        "compile_cache_configured",
+        cache_key=key,
+        inductor_cache_dir=os.environ["TORCHINDUCTOR_CACHE_DIR"],
+        triton_cache_dir=os.environ["TRITON_CACHE_DIR"],
+    )
+    return key
+
+
+def compile_for_inference(module: object) -> bool:
+    """Compile a torch module in place with ``torch.compile``.
+
+    Uses the default mode (Inductor kernels, no CUDA graphs) with
+    ``dynamic=None``: the first input shape is compiled statically, and the
+    first shape change recompiles once with dynamic dimensions. TTS inputs
+    (phoneme counts, a growing KV cache under ``generate()``) vary per
+    request, so static shapes would recompile on the request path for every
+    new length until dynamo's recompile limit drops the frame to eager.
+    Warmup with several lengths therefore pays the dynamic recompile at
+    startup. CUDA graphs (``mode="reduce-overhead"``) are avoided: their state
+    is thread-local, so every inference executor thread would re-record, and
+    a KV cache under ``generate()`` records a new graph per length.
+    Compilation failures are non-fatal — the module keeps running eagerly.
+
+    Returns:
+        True if the module was compiled, False otherwise.
+    """
+    compile_fn = getattr(module, "compile", None)
+    if not callable(compile_fn):
+        logger.warning("torch_compile_unsupported", module=type(module).__name__)
+        return False
+    try:
+        compile_fn(dynamic=None)
+    except Exception as exc:
+        logger.warning("torch_compile_failed", module=type(module).__name__, error=str(exc))
+        return False
+    logger.info("torch_compile_enabled", module=type(module).__name__)
+    return True
+
+
 def resolve_device(device_str: str) -> str:
     """Resolve device string, probing CUDA availability for "auto".
 
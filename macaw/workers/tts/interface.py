@@ -22,7 +22,7 @@ class TTSBackend(ABC):
     Adding a new engine requires:
     1. Implement TTSBackend
     2. Create a macaw.yaml manifest with type: tts
-    3. Register in the _create_backend() factory
+    3. Register in the _ENGINE_MODULES table of the TTS worker
     Zero changes to the runtime core.
 
     The key difference from STTBackend is that synthesize() returns an
@@ -22,8 +22,17 @@ import numpy as np
 from macaw._types import TTSEngineCapabilities, VoiceInfo
 from macaw.exceptions import ModelLoadError, TTSSynthesisError
 from macaw.logging import get_logger
-from macaw.workers.torch_utils import release_gpu_memory, resolve_device
-from macaw.workers.tts.audio_utils import CHUNK_SIZE_BYTES, float32_to_pcm16_bytes
+from macaw.workers.torch_utils import (
+    compile_for_inference,
+    configure_compile_cache,
+    release_gpu_memory,
+    resolve_device,
+)
+from macaw.workers.tts.audio_utils import (
+    DEFAULT_CHUNK_MS,
+    chunk_size_bytes,
+    float32_to_pcm16_bytes,
+)
 from macaw.workers.tts.interface import TTSBackend
 
 if TYPE_CHECKING:
@@ -65,6 +74,7 @@ class KokoroBackend(TTSBackend):
         self._model_path: str = ""
         self._voices_dir: str = ""
         self._default_voice: str = "af_heart"
+        self._chunk_bytes: int = chunk_size_bytes(DEFAULT_CHUNK_MS, _DEFAULT_SAMPLE_RATE)
 
     async def capabilities(self) -> TTSEngineCapabilities:
         return TTSEngineCapabilities(supports_streaming=True)
@@ -77,7 +87,13 @@ class KokoroBackend(TTSBackend):
         device_str = str(config.get("device", "cpu"))
         device = resolve_device(device_str)
         lang_code = str(config.get("lang_code", "a"))
+        torch_compile = bool(config.get("torch_compile", False))
         self._default_voice = str(config.get("default_voice", "af_heart"))
+        chunk_ms = int(config.get("chunk_ms", DEFAULT_CHUNK_MS))  # type: ignore[call-overload]
+        if chunk_ms <= 0:
+            msg = f"chunk_ms must be positive, got {chunk_ms}"
+            raise ModelLoadError(model_path, msg)
+        self._chunk_bytes = chunk_size_bytes(chunk_ms, _DEFAULT_SAMPLE_RATE)
 
         # Find config.json and weights file in model_path
         config_path = os.path.join(model_path, "config.json")
@@ -94,6 +110,9 @@ class KokoroBackend(TTSBackend):
         if os.path.isdir(voices_dir):
             self._voices_dir = voices_dir
 
+        if torch_compile:
+            configure_compile_cache("kokoro", model_path, device)
+
         loop = asyncio.get_running_loop()
         try:
             model, pipeline = await loop.run_in_executor(
@@ -103,6 +122,7 @@ class KokoroBackend(TTSBackend):
                     weights_path,
                     lang_code,
                     device,
+                    torch_compile=torch_compile,
                 ),
             )
         except Exception as exc:
@@ -191,13 +211,17 @@ class KokoroBackend(TTSBackend):
         )
 
         has_audio = False
+        chunk_bytes = self._chunk_bytes
         while True:
             pcm_bytes = await queue.get()
             if pcm_bytes is None:
                 break
             has_audio = True
-            for i in range(0, len(pcm_bytes), CHUNK_SIZE_BYTES):
-                yield pcm_bytes[i : i + CHUNK_SIZE_BYTES]
+            # Each segment's tail is flushed immediately rather than carried
+            # into the next one, so playback never stalls mid-word while the
+            # next sentence is synthesized.
+            for i in range(0, len(pcm_bytes), chunk_bytes):
+                yield pcm_bytes[i : i + chunk_bytes]
 
         await future
 
@@ -265,6 +289,8 @@ def _load_kokoro_model(
     weights_path: str,
     lang_code: str,
     device: str,
+    *,
+    torch_compile: bool = False,
 ) -> tuple[object, object]:
     """Load the Kokoro model and create the pipeline (blocking).
 
@@ -273,6 +299,7 @@ def _load_kokoro_model(
         weights_path: Path to .pth file.
         lang_code: Language code ('a'=en, 'p'=pt, etc).
         device: Device string ("cpu", "cuda").
+        torch_compile: Compile the model in place with torch.compile.
 
     Returns:
         Tuple (model, pipeline).
@@ -288,6 +315,8 @@ def _load_kokoro_model(
         warnings.filterwarnings("ignore", category=DeprecationWarning)
         model = kokoro_lib.KModel(config=config_path, model=weights_path)
         model = model.to(device).eval()
+        if torch_compile:
+            compile_for_inference(model)
         pipeline = kokoro_lib.KPipeline(
             lang_code=lang_code,
             repo_id="hexgrad/Kokoro-82M",
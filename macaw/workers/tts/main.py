@@ -14,45 +14,103 @@ configure_cuda_env()
 
 import argparse  # noqa: E402
 import asyncio  # noqa: E402
+import importlib  # noqa: E402
+import os  # noqa: E402
 import signal  # noqa: E402
 import sys  # noqa: E402
 import time  # noqa: E402
-from typing import TYPE_CHECKING  # noqa: E402
-
-import grpc.aio  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+from typing import TYPE_CHECKING, Any  # noqa: E402
 
 from macaw.logging import configure_logging, get_logger  # noqa: E402
-from macaw.proto import add_TTSWorkerServicer_to_server  # noqa: E402
-from macaw.workers.torch_utils import configure_torch_inference  # noqa: E402
-from macaw.workers.tts.servicer import TTSWorkerServicer  # noqa: E402
+from macaw.workers.torch_utils import (  # noqa: E402
+    configure_jit_executor,
+    configure_torch_inference,
+    configure_torch_threads,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Coroutine
+    from concurrent.futures import Future
+    from types import ModuleType
+
     from macaw.workers.tts.interface import TTSBackend
 
 logger = get_logger("worker.tts.main")
 
 STOP_GRACE_PERIOD = 5.0
 
+# Explicit bound on concurrent streams per HTTP/2 connection (gRPC core
+# advertises no limit by default). The runtime multiplexes all TTS requests
+# over one channel per worker; beyond this, excess streams queue client-side
+# instead of oversubscribing the inference executor.
+GRPC_MAX_CONCURRENT_STREAMS = 256
+
+# Keepalive: the runtime caches one channel per worker and may leave it idle
+# between bursts. Server pings keep it (and any NAT/conntrack entry) warm and
+# detect dead peers, so a burst never starts with a reconnect. Connection
+# idle/age limits are left at gRPC's defaults (unlimited).
+_GRPC_SERVER_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_time_between_pings_ms", 15_000),
+    ("grpc.http2.min_recv_ping_interval_without_data_ms", 5_000),
+    # Keepalive pings on an idle channel are data-less; without this, gRPC
+    # stops pinging after 2 (the default) until the next call.
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_concurrent_streams", GRPC_MAX_CONCURRENT_STREAMS),
+]
+
+
+# Engine name -> (module, TTSBackend class). The module is preloaded right
+# after argument parsing and instantiated by _create_backend.
+_ENGINE_MODULES: dict[str, tuple[str, str]] = {
+    "kokoro": ("macaw.workers.tts.kokoro", "KokoroBackend"),
+    "qwen3-tts": ("macaw.workers.tts.qwen3", "Qwen3TTSBackend"),
+}
+
+
+def _preload_engine_module(engine: str) -> Future[ModuleType] | None:
+    """Start importing the engine module in a background thread.
+
+    Engine modules pull in torch and the inference library, which can take
+    seconds. Starting the import right after argument parsing overlaps it
+    with the rest of startup; ``_create_backend`` then finds the module in
+    ``sys.modules`` (or waits on the import lock). Import errors surface
+    later from ``_create_backend``.
+
+    Returns:
+        Future of the import, or None for unknown engines.
+    """
+    entry = _ENGINE_MODULES.get(engine)
+    if entry is None:
+        return None
+    module_name, _ = entry
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="engine-preload")
+    future = executor.submit(importlib.import_module, module_name)
+    executor.shutdown(wait=False)
+    return future
+
 
 def _create_backend(engine: str) -> TTSBackend:
     """Create a TTSBackend instance based on the engine name.
 
+    Engine modules are imported lazily (they pull in torch and the inference
+    library); when preloaded, the import is already done or in progress.
+
     Raises:
         ValueError: If the engine is not supported.
     """
-    # TODO: Refactor to dispatch dict when 3rd engine is added
-    if engine == "kokoro":
-        from macaw.workers.tts.kokoro import KokoroBackend
-
-        return KokoroBackend()
-
-    if engine == "qwen3-tts":
-        from macaw.workers.tts.qwen3 import Qwen3TTSBackend
-
-        return Qwen3TTSBackend()
+    entry = _ENGINE_MODULES.get(engine)
+    if entry is None:
+        msg = f"Unsupported TTS engine: {engine}"
+        raise ValueError(msg)
 
-    msg = f"Unsupported TTS engine: {engine}"
-    raise ValueError(msg)
+    module_name, class_name = entry
+    module = importlib.import_module(module_name)
+    backend: TTSBackend = getattr(module, class_name)()
+    return backend
 
 
 async def serve(
@@ -69,7 +127,31 @@ async def serve(
         model_path: Path to model files.
         engine_config: Engine configuration (device, etc).
     """
+    # Imported here so `--help` and argument errors skip grpc/proto loading.
+    import grpc.aio
+
+    from macaw.proto import add_TTSWorkerServicer_to_server
+    from macaw.workers.tts.servicer import TTSWorkerServicer
+
     configure_torch_inference()
+    configure_jit_executor()
+
+    loop = asyncio.get_running_loop()
+    inference_cpus: set[int] | None = None
+    cpu_partition = _resolve_cpu_partition(engine_config)
+    if cpu_partition is not None:
+        io_cpus, inference_cpus = cpu_partition
+        # New threads inherit their creator's affinity: pinning this thread
+        # before the gRPC server starts keeps gRPC core threads off the
+        # inference cores (pid 0 = calling thread on Linux).
+        os.sched_setaffinity(0, io_cpus)
+        configure_torch_threads(len(inference_cpus))
+        logger.info(
+            "cpu_affinity_configured",
+            io_cpus=sorted(io_cpus),
+            inference_cpus=sorted(inference_cpus),
+        )
+    loop.set_default_executor(_create_inference_executor(engine_config, cpus=inference_cpus))
 
     backend = _create_backend(engine)
 
@@ -77,52 +159,117 @@ async def serve(
     await backend.load(model_path, engine_config)
     logger.info("model_loaded", engine=engine)
 
-    warmup_steps = int(engine_config.get("warmup_steps", 3))  # type: ignore[call-overload]
-    await _warmup_backend(backend, warmup_steps=warmup_steps)
+    warmup_texts = _resolve_warmup_texts(engine_config.get("warmup_lengths"))
+    warmup_steps = int(engine_config.get("warmup_steps", len(warmup_texts)))  # type: ignore[call-overload]
 
     model_name = str(engine_config.get("model_name", "unknown"))
+    ready = asyncio.Event()
     servicer = TTSWorkerServicer(
         backend=backend,
         model_name=model_name,
         engine=engine,
+        ready=ready,
     )
 
-    server = grpc.aio.server(
-        options=[
-            ("grpc.http2.min_recv_ping_interval_without_data_ms", 5_000),
-            ("grpc.keepalive_permit_without_calls", 1),
-        ]
-    )
+    server = grpc.aio.server(options=_GRPC_SERVER_OPTIONS)
     add_TTSWorkerServicer_to_server(servicer, server)  # type: ignore[no-untyped-call]
     listen_addr = f"[::]:{port}"
     server.add_insecure_port(listen_addr)
 
-    loop = asyncio.get_running_loop()
-    shutting_down = False
-    shutdown_task: asyncio.Task[None] | None = None
+    shutdown_event = asyncio.Event()
+    warmup_task: asyncio.Task[None] | None = None
 
-    async def _shutdown() -> None:
-        nonlocal shutting_down
-        if shutting_down:
-            return
-        shutting_down = True
+    async def _shutdown_when_set() -> None:
+        await shutdown_event.wait()
         logger.info("shutdown_start", grace_period=STOP_GRACE_PERIOD)
+        if warmup_task is not None and not warmup_task.done():
+            warmup_task.cancel()
         await server.stop(STOP_GRACE_PERIOD)
         await backend.unload()
         logger.info("shutdown_complete")
 
-    def _signal_handler() -> None:
-        nonlocal shutdown_task
-        shutdown_task = asyncio.ensure_future(_shutdown())
-        shutdown_task.add_done_callback(lambda t: t.exception() if not t.cancelled() else None)
+    # Created once up front: repeated signals only re-set the event, so
+    # shutdown can never be scheduled twice.
+    shutdown_task = asyncio.create_task(_shutdown_when_set())
 
     for sig in (signal.SIGTERM, signal.SIGINT):
-        loop.add_signal_handler(sig, _signal_handler)
+        loop.add_signal_handler(sig, shutdown_event.set)
 
     await server.start()
     logger.info("worker_started", port=port, engine=engine)
 
-    await server.wait_for_termination()
+    warmup_task = asyncio.create_task(
+        _warmup_in_background(
+            backend,
+            ready,
+            warmup_steps=warmup_steps,
+            warmup_texts=warmup_texts,
+        )
+    )
+
+    # Shutdown is driven solely by shutdown_event: serve() returns once the
+    # server has drained and the backend is unloaded.
+    await shutdown_task
+
+
+def _resolve_cpu_partition(
+    engine_config: dict[str, object],
+) -> tuple[set[int], set[int]] | None:
+    """Split the usable CPUs into event-loop/gRPC cores and inference cores.
+
+    ``engine_config["io_cpus"]`` lists the cores reserved for the event loop
+    and gRPC threads; every other core the process may run on goes to the
+    inference executor. Opt-in: returns None when unset, invalid, or when the
+    platform has no ``sched_setaffinity`` (e.g., macOS).
+    """
+    io_cpus_config = engine_config.get("io_cpus")
+    if not io_cpus_config or not hasattr(os, "sched_setaffinity"):
+        return None
+
+    try:
+        requested = {int(cpu) for cpu in io_cpus_config}  # type: ignore[attr-defined]
+    except (TypeError, ValueError):
+        logger.warning("io_cpus_invalid", io_cpus=io_cpus_config)
+        return None
+
+    available = os.sched_getaffinity(0)
+    io_cpus = requested & available
+    inference_cpus = available - io_cpus
+    if not io_cpus or not inference_cpus:
+        logger.warning(
+            "io_cpus_ignored",
+            io_cpus=sorted(requested),
+            available_cpus=sorted(available),
+        )
+        return None
+    return io_cpus, inference_cpus
+
+
+def _create_inference_executor(
+    engine_config: dict[str, object],
+    *,
+    cpus: set[int] | None = None,
+) -> ThreadPoolExecutor:
+    """Create the dedicated executor for blocking backend inference.
+
+    Servicer handlers are coroutines on the event loop; backends offload
+    synthesis via ``run_in_executor(None, ...)``. Installing this pool as the
+    loop's default executor keeps a long synthesis from starving the gRPC I/O
+    path. Size via ``engine_config["inference_workers"]`` (default 2x CPUs).
+    When ``cpus`` is given, every pool thread is pinned to those cores and the
+    default size is one thread per pinned core, so they are not oversubscribed.
+    """
+    default_workers = len(cpus) if cpus is not None else (os.cpu_count() or 1) * 2
+    max_workers = int(engine_config.get("inference_workers", default_workers))  # type: ignore[call-overload]
+    logger.info("inference_executor_created", max_workers=max_workers)
+    if cpus is None:
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts-inference")
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="tts-inference",
+        initializer=os.sched_setaffinity,
+        initargs=(0, cpus),
+    )
 
 
 _WARMUP_TEXTS = (
@@ -131,20 +278,68 @@ _WARMUP_TEXTS = (
     "The quick brown fox jumps over the lazy dog. Pack my box with five dozen liquor jugs.",
 )
 
+_WARMUP_WORDS = _WARMUP_TEXTS[2].split()
+
+# Upper bound per warmup pass so a stuck compile never blocks worker startup
+_WARMUP_STEP_TIMEOUT_S = 60.0
+
 # PCM 16-bit at 24kHz: 2 bytes per sample
 _TTS_SAMPLE_RATE = 24000
 _TTS_BYTES_PER_SAMPLE = 2
 
 
-async def _warmup_backend(backend: TTSBackend, *, warmup_steps: int = 3) -> None:
+def _build_warmup_text(num_words: int) -> str:
+    """Build a warmup text with exactly ``num_words`` words of natural language."""
+    return " ".join(_WARMUP_WORDS[i % len(_WARMUP_WORDS)] for i in range(num_words))
+
+
+def _resolve_warmup_texts(warmup_lengths: object) -> tuple[str, ...]:
+    """Resolve the ``warmup_lengths`` engine config into warmup texts.
+
+    Compiled graphs (torch.compile, Triton) specialize per sequence length,
+    so each configured length (in words) gets its own warmup pass. Falls back
+    to the default texts when unset or invalid.
+    """
+    if not isinstance(warmup_lengths, list | tuple) or not warmup_lengths:
+        return _WARMUP_TEXTS
+
+    try:
+        lengths = [int(n) for n in warmup_lengths]
+    except (TypeError, ValueError):
+        logger.warning("warmup_lengths_invalid", warmup_lengths=warmup_lengths)
+        return _WARMUP_TEXTS
+
+    return tuple(_build_warmup_text(n) for n in lengths if n > 0) or _WARMUP_TEXTS
+
+
+async def _drain_synthesis(backend: TTSBackend, text: str) -> int:
+    """Consume a full synthesis stream, returning the total PCM bytes produced."""
+    total_bytes = 0
+    # synthesize() is an async generator in concrete backends
+    async for chunk in backend.synthesize(text):  # type: ignore[attr-defined]
+        total_bytes += len(chunk)
+    return total_bytes
+
+
+async def _warmup_backend(
+    backend: TTSBackend,
+    *,
+    warmup_steps: int = 3,
+    warmup_texts: tuple[str, ...] = _WARMUP_TEXTS,
+    step_timeout_s: float = _WARMUP_STEP_TIMEOUT_S,
+) -> None:
     """Run warmup synthesis passes to prime GPU caches, JIT, and memory pools.
 
     Multiple passes with varied text lengths exercise different decoder
-    configurations. RTFx is measured on the final pass as a readiness signal.
+    configurations. Each stream is drained fully so that every sequence
+    length is compiled once at startup. RTFx is measured on the final pass
+    as a readiness signal.
 
     Args:
         backend: Loaded TTS backend.
         warmup_steps: Number of warmup passes (default 3). Set to 0 to skip.
+        warmup_texts: Texts cycled across passes, typically of increasing length.
+        step_timeout_s: Maximum duration of a single pass before warmup is aborted.
     """
     if warmup_steps <= 0:
         logger.info("warmup_skipped", warmup_steps=warmup_steps)
@@ -153,15 +348,14 @@ async def _warmup_backend(backend: TTSBackend, *, warmup_steps: int = 3) -> None
     rtfx: float | None = None
 
     for step in range(warmup_steps):
-        text = _WARMUP_TEXTS[step % len(_WARMUP_TEXTS)]
+        text = warmup_texts[step % len(warmup_texts)]
         is_last = step == warmup_steps - 1
 
         try:
             start = time.monotonic()
-            total_bytes = 0
-            # synthesize() is an async generator in concrete backends
-            async for chunk in backend.synthesize(text):  # type: ignore[attr-defined]
-                total_bytes += len(chunk)
+            total_bytes = await asyncio.wait_for(
+                _drain_synthesis(backend, text), timeout=step_timeout_s
+            )
             elapsed = time.monotonic() - start
 
             if is_last and elapsed > 0 and total_bytes > 0:
@@ -175,6 +369,9 @@ async def _warmup_backend(backend: TTSBackend, *, warmup_steps: int = 3) -> None
                 text_len=len(text),
                 elapsed_s=round(elapsed, 3),
             )
+        except TimeoutError:
+            logger.warning("warmup_step_timeout", step=step + 1, timeout_s=step_timeout_s)
+            return
         except Exception as exc:
             logger.warning("warmup_step_failed", step=step + 1, error=str(exc))
             return
@@ -189,6 +386,23 @@ async def _warmup_backend(backend: TTSBackend, *, warmup_steps: int = 3) -> None
         logger.info("warmup_complete", rtfx=round(rtfx, 2), warmup_steps=warmup_steps)
 
 
+async def _warmup_in_background(
+    backend: TTSBackend,
+    ready: asyncio.Event,
+    *,
+    warmup_steps: int,
+    warmup_texts: tuple[str, ...],
+) -> None:
+    """Run warmup while the server is already accepting connections.
+
+    ``ready`` is set once warmup finishes. Warmup failures are logged by
+    ``_warmup_backend`` and are non-fatal — the worker then serves cold.
+    """
+    await _warmup_backend(backend, warmup_steps=warmup_steps, warmup_texts=warmup_texts)
+    ready.set()
+    logger.info("worker_ready")
+
+
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(description="Macaw TTS Worker (gRPC)")
@@ -206,17 +420,44 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _parse_engine_config(raw: str) -> dict[str, object]:
+    """Parse the ``--engine-config`` JSON string, using orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.loads(raw)  # type: ignore[no-any-return]
+    return orjson.loads(raw)  # type: ignore[no-any-return]
+
+
+def _run_event_loop(main_coro: Coroutine[Any, Any, None]) -> None:
+    """Run the worker coroutine on uvloop when installed, else the stdlib loop.
+
+    uvloop (pulled in by ``uvicorn[standard]``) lowers per-callback overhead
+    for grpc.aio, where every streamed audio chunk crosses an ``await``.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main_coro)
+        return
+
+    logger.info("event_loop_selected", loop="uvloop")
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(main_coro)
+
+
 def main(argv: list[str] | None = None) -> None:
     """Main entry point for the TTS worker."""
-    import json
-
-    configure_logging()
     args = parse_args(argv)
+    _preload_engine_module(args.engine)
+    configure_logging()
 
-    engine_config: dict[str, object] = json.loads(args.engine_config)
+    engine_config = _parse_engine_config(args.engine_config)
 
     try:
-        asyncio.run(
+        _run_event_loop(
             serve(
                 port=args.port,
                 engine=args.engine,
@@ -25,8 +25,17 @@ from macaw._types import TTSEngineCapabilities, VoiceInfo
 from macaw.exceptions import ModelLoadError, TTSSynthesisError
 from macaw.logging import get_logger
 from macaw.workers.audio_utils import PCM_INT16_MAX, PCM_INT32_MAX
-from macaw.workers.torch_utils import release_gpu_memory, resolve_device
-from macaw.workers.tts.audio_utils import CHUNK_SIZE_BYTES, float32_to_pcm16_bytes
+from macaw.workers.torch_utils import (
+    compile_for_inference,
+    configure_compile_cache,
+    release_gpu_memory,
+    resolve_device,
+)
+from macaw.workers.tts.audio_utils import (
+    DEFAULT_CHUNK_MS,
+    chunk_size_bytes,
+    float32_to_pcm16_bytes,
+)
 from macaw.workers.tts.interface import TTSBackend
 
 if TYPE_CHECKING:
@@ -77,6 +86,7 @@ class Qwen3TTSBackend(TTSBackend):
         self._default_voice: str = "vivian"
         self._default_language: str = "English"
         self._sample_rate: int = 24000
+        self._chunk_ms: int = DEFAULT_CHUNK_MS
 
     async def capabilities(self) -> TTSEngineCapabilities:
         return TTSEngineCapabilities(
@@ -94,22 +104,33 @@ class Qwen3TTSBackend(TTSBackend):
         dtype_str = str(config.get("dtype", "bfloat16"))
         attn_impl = str(config.get("attn_implementation", "sdpa"))
         variant = str(config.get("variant", "custom_voice"))
+        torch_compile = bool(config.get("torch_compile", False))
+        chunk_ms = int(config.get("chunk_ms", DEFAULT_CHUNK_MS))  # type: ignore[call-overload]
 
         if variant not in _VALID_VARIANTS:
             msg = f"Invalid variant: {variant}. Valid: {', '.join(sorted(_VALID_VARIANTS))}"
             raise ModelLoadError(model_path, msg)
+        if chunk_ms <= 0:
+            msg = f"chunk_ms must be positive, got {chunk_ms}"
+            raise ModelLoadError(model_path, msg)
+
+        self._chunk_ms = chunk_ms
 
         self._variant = variant
         self._default_voice = str(config.get("default_voice", "Chelsie"))
         self._default_language = str(config.get("default_language", "English"))
 
         device = resolve_device(device_str)
+        if torch_compile:
+            configure_compile_cache("qwen3-tts", model_path, device)
 
         loop = asyncio.get_running_loop()
         try:
             model, sample_rate = await loop.run_in_executor(
                 None,
-                lambda: _load_qwen3_model(model_path, device, dtype_str, attn_impl),
+                lambda: _load_qwen3_model(
+                    model_path, device, dtype_str, attn_impl, torch_compile=torch_compile
+                ),
             )
         except ModelLoadError:
             raise
@@ -193,8 +214,9 @@ class Qwen3TTSBackend(TTSBackend):
             msg = "Synthesis returned empty audio"
             raise TTSSynthesisError(self._model_path, msg)
 
-        for i in range(0, len(audio_data), CHUNK_SIZE_BYTES):
-            yield audio_data[i : i + CHUNK_SIZE_BYTES]
+        chunk_bytes = chunk_size_bytes(self._chunk_ms, self._sample_rate)
+        for i in range(0, len(audio_data), chunk_bytes):
+            yield audio_data[i : i + chunk_bytes]
 
     async def voices(self) -> list[VoiceInfo]:
         if self._variant == "custom_voice":
@@ -246,9 +268,14 @@ def _load_qwen3_model(
     device: str,
     dtype_str: str,
     attn_impl: str,
+    *,
+    torch_compile: bool = False,
 ) -> tuple[object, int]:
     """Load Qwen3-TTS model (blocking, runs in executor).
 
+    When ``torch_compile`` is set, the underlying transformer module
+    (``model.model``) is compiled in place.
+
     Returns:
         Tuple (model, sample_rate).
     """
@@ -259,6 +286,8 @@ def _load_qwen3_model(
         dtype=dtype,
         attn_implementation=attn_impl,
     )
+    if torch_compile:
+        compile_for_inference(getattr(model, "model", model))
 
     # Determine sample rate from a dummy generation or default
     sample_rate = 24000
@@ -23,6 +23,7 @@ from macaw.workers.tts.converters import (
 )
 
 if TYPE_CHECKING:
+    import asyncio
     from collections.abc import AsyncIterator
 
     from macaw.proto.tts_worker_pb2 import (
@@ -44,6 +45,10 @@ class TTSWorkerServicer(_BaseServicer):
 
     Receives gRPC requests, delegates to TTSBackend, returns proto responses.
     Synthesize is server-streaming: text in, audio chunks out.
+
+    When ``ready`` is given, the servicer rejects Synthesize with UNAVAILABLE
+    and reports ``"loading"`` on Health until the event is set (e.g., while
+    warmup runs in the background).
     """
 
     def __init__(
@@ -51,10 +56,15 @@ class TTSWorkerServicer(_BaseServicer):
         backend: TTSBackend,
         model_name: str,
         engine: str,
+        ready: asyncio.Event | None = None,
     ) -> None:
         self._backend = backend
         self._model_name = model_name
         self._engine = engine
+        self._ready = ready
+
+    def _is_ready(self) -> bool:
+        return self._ready is None or self._ready.is_set()
 
     async def Synthesize(  # noqa: N802  # type: ignore[override]
         self,
@@ -70,6 +80,11 @@ class TTSWorkerServicer(_BaseServicer):
         request_id = request.request_id
         text = params.text
 
+        if not self._is_ready():
+            logger.warning("synthesize_not_ready", request_id=request_id)
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "Worker is warming up")
+            return  # pragma: no cover
+
         if not text.strip():
             logger.warning("synthesize_empty_text", request_id=request_id)
             await context.abort(
@@ -179,5 +194,9 @@ class TTSWorkerServicer(_BaseServicer):
         context: grpc.aio.ServicerContext[HealthRequest, HealthResponse],
     ) -> HealthResponse:
         """Health check for the TTS worker."""
+        if not self._is_ready():
+            return health_dict_to_proto_response(
+                {"status": "loading"}, self._model_name, self._engine
+            )
         health = await self._backend.health()
         return health_dict_to_proto_response(health, self._model_name, self._engine)
@@ -9,8 +9,8 @@ Marcado como @pytest.mark.integration — requer `openai` instalado.
 from __future__ import annotations
 
 import io
-from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
 
 import anyio
 import httpx
@@ -20,8 +20,13 @@ from macaw._types import BatchResult, SegmentDetail, WordTimestamp
 from macaw.server.app import create_app
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from fastapi import FastAPI
 
+openai = pytest.importorskip("openai")
+OpenAI = openai.OpenAI
+
 
 def _make_batch_result() -> BatchResult:
     return BatchResult(
@@ -41,14 +46,15 @@ def _make_batch_result() -> BatchResult:
 
 
 def _make_app() -> FastAPI:
-    registry = MagicMock()
-    registry.has_model.return_value = True
-    registry.get_manifest.return_value = MagicMock()
+    result = _make_batch_result()
+
+    async def _transcribe(*_: object) -> BatchResult:
+        return result
 
-    scheduler = MagicMock()
-    scheduler.transcribe = AsyncMock(return_value=_make_batch_result())
+    registry = SimpleNamespace(has_model=lambda *_: True, get_manifest=lambda *_: object())
+    scheduler = SimpleNamespace(transcribe=_transcribe, cancel=lambda *_: False)
 
-    return create_app(registry=registry, scheduler=scheduler)
+    return create_app(registry=registry, scheduler=scheduler)  # type: ignore[arg-type]
 
 
 class _SyncASGITransport(httpx.BaseTransport):
@@ -80,52 +86,53 @@ class _SyncASGITransport(httpx.BaseTransport):
         anyio.run(_close)
 
 
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    """App construido uma vez por modulo — os mocks sao somente leitura."""
+    return _make_app()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _warm_openai_models() -> None:
+    """Constroi os validators Pydantic do SDK uma vez, nao no primeiro call de cada teste."""
+    from openai.types.audio import Transcription, TranscriptionVerbose, Translation
+
+    for model_cls in (Transcription, TranscriptionVerbose, Translation):
+        model_cls.model_rebuild()
+
+
+@pytest.fixture(scope="module")
+def openai_client(app: FastAPI) -> Iterator[Any]:
+    """Cliente do SDK OpenAI ligado ao app in-process, compartilhado pelo modulo."""
+    http_client = httpx.Client(transport=_SyncASGITransport(app), base_url="http://macaw.test")
+    yield OpenAI(
+        base_url="http://macaw.test/v1",
+        api_key="not-needed",
+        http_client=http_client,
+    )
+    http_client.close()
+
+
 @pytest.mark.integration
 class TestOpenAISDKCompat:
     """Testes usando o SDK `openai` como cliente real."""
 
-    @pytest.fixture(autouse=True)
-    def _client(self) -> object:  # type: ignore[misc]
-        app = _make_app()
-        transport = _SyncASGITransport(app)
-        http_client = httpx.Client(transport=transport, base_url="http://macaw.test")
-        self._http_client = http_client
-        self._base_url = "http://macaw.test/v1"
-        yield
-        http_client.close()
-
-    def test_transcribe_returns_text(self) -> None:
-        from openai import OpenAI
-
-        client = OpenAI(
-            base_url=self._base_url,
-            api_key="not-needed",
-            http_client=self._http_client,
-        )
-
+    def test_transcribe_returns_text(self, openai_client: Any) -> None:
         audio_file = io.BytesIO(b"fake-audio-data")
         audio_file.name = "audio.wav"
 
-        result = client.audio.transcriptions.create(
+        result = openai_client.audio.transcriptions.create(
             model="faster-whisper-tiny",
             file=audio_file,
         )
 
         assert result.text == "Hello, how can I help you?"
 
-    def test_transcribe_verbose_json(self) -> None:
-        from openai import OpenAI
-
-        client = OpenAI(
-            base_url=self._base_url,
-            api_key="not-needed",
-            http_client=self._http_client,
-        )
-
+    def test_transcribe_verbose_json(self, openai_client: Any) -> None:
         audio_file = io.BytesIO(b"fake-audio-data")
         audio_file.name = "audio.wav"
 
-        result = client.audio.transcriptions.create(
+        result = openai_client.audio.transcriptions.create(
             model="faster-whisper-tiny",
             file=audio_file,
             response_format="verbose_json",
@@ -137,38 +144,22 @@ class TestOpenAISDKCompat:
         assert result.segments is not None
         assert len(result.segments) > 0
 
-    def test_translate_returns_text(self) -> None:
-        from openai import OpenAI
-
-        client = OpenAI(
-            base_url=self._base_url,
-            api_key="not-needed",
-            http_client=self._http_client,
-        )
-
+    def test_translate_returns_text(self, openai_client: Any) -> None:
         audio_file = io.BytesIO(b"fake-audio-data")
         audio_file.name = "audio.wav"
 
-        result = client.audio.translations.create(
+        result = openai_client.audio.translations.create(
             model="faster-whisper-tiny",
             file=audio_file,
         )
 
         assert result.text == "Hello, how can I help you?"
 
-    def test_transcribe_text_format(self) -> None:
-        from openai import OpenAI
-
-        client = OpenAI(
-            base_url=self._base_url,
-            api_key="not-needed",
-            http_client=self._http_client,
-        )
-
+    def test_transcribe_text_format(self, openai_client: Any) -> None:
         audio_file = io.BytesIO(b"fake-audio-data")
         audio_file.name = "audio.wav"
 
-        result = client.audio.transcriptions.create(
+        result = openai_client.audio.transcriptions.create(
             model="faster-whisper-tiny",
             file=audio_file,
             response_format="text",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from itertools import cycle
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
@@ -13,22 +14,28 @@ if TYPE_CHECKING:
 from macaw.cli import cli
 from macaw.registry.catalog import CatalogEntry
 
+# (engine, model_type, architecture) alternated across dummy entries
+_ENTRY_KINDS: tuple[tuple[str, str, str | None], ...] = (
+    ("faster-whisper", "stt", "encoder-decoder"),
+    ("kokoro", "tts", None),
+)
+
 
 def _make_entries(count: int) -> list[CatalogEntry]:
     """Create dummy catalog entries for testing."""
-    entries: list[CatalogEntry] = []
-    for i in range(count):
-        entries.append(
-            CatalogEntry(
-                name=f"model-{i}",
-                repo=f"org/model-{i}",
-                engine="faster-whisper" if i % 2 == 0 else "kokoro",
-                model_type="stt" if i % 2 == 0 else "tts",
-                architecture="encoder-decoder" if i % 2 == 0 else None,
-                description=f"Description for model {i}",
-            )
+    return [
+        CatalogEntry(
+            name=f"model-{i}",
+            repo=f"org/model-{i}",
+            engine=engine,
+            model_type=model_type,
+            architecture=architecture,
+            description=f"Description for model {i}",
+        )
+        for i, (engine, model_type, architecture) in zip(
+            range(count), cycle(_ENTRY_KINDS), strict=False
         )
-    return entries
+    ]
 
 
 class TestCatalogCommand:
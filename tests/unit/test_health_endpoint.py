@@ -2,13 +2,47 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
 import httpx
+import pytest
 
 import macaw
 from macaw.server.app import create_app
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from fastapi import FastAPI
+
+    ClientFactory = Callable[..., httpx.AsyncClient]
+
+
+@pytest.fixture(scope="module")
+def shared_app() -> FastAPI:
+    """Single app per module — routes read registry/worker_manager from app.state."""
+    return create_app()
+
+
+@pytest.fixture(scope="module")
+def shared_transport(shared_app: FastAPI) -> httpx.ASGITransport:
+    return httpx.ASGITransport(app=shared_app)
+
+
+@pytest.fixture()
+def client_factory(shared_app: FastAPI, shared_transport: httpx.ASGITransport) -> ClientFactory:
+    """Return a factory that injects mocks into the shared app and builds a client."""
+
+    def _factory(
+        *, registry: object | None = None, worker_manager: object | None = None
+    ) -> httpx.AsyncClient:
+        shared_app.state.registry = registry
+        shared_app.state.worker_manager = worker_manager
+        return httpx.AsyncClient(transport=shared_transport, base_url="http://test")
+
+    return _factory
+
 
 async def test_create_app_returns_fastapi_instance() -> None:
     app = create_app()
@@ -16,12 +50,10 @@ async def test_create_app_returns_fastapi_instance() -> None:
     assert app.title == "Macaw OpenVoice"
 
 
-async def test_health_endpoint_returns_ok_without_worker_manager() -> None:
-    app = create_app()
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
+async def test_health_endpoint_returns_ok_without_worker_manager(
+    client_factory: ClientFactory,
+) -> None:
+    async with client_factory() as client:
         response = await client.get("/health")
 
     assert response.status_code == 200
@@ -30,15 +62,12 @@ async def test_health_endpoint_returns_ok_without_worker_manager() -> None:
     assert body["version"] == macaw.__version__
 
 
-async def test_health_endpoint_includes_models_loaded_when_registry_present() -> None:
-    registry = MagicMock()
-    registry.list_models.return_value = [MagicMock(), MagicMock()]
-    app = create_app(registry=registry)
+async def test_health_endpoint_includes_models_loaded_when_registry_present(
+    client_factory: ClientFactory,
+) -> None:
+    registry = SimpleNamespace(list_models=lambda: [object(), object()])
 
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
+    async with client_factory(registry=registry) as client:
         response = await client.get("/health")
 
     assert response.status_code == 200
@@ -46,20 +75,14 @@ async def test_health_endpoint_includes_models_loaded_when_registry_present() ->
     assert body["models_loaded"] == 2
 
 
-async def test_health_returns_ok_when_all_workers_ready() -> None:
-    worker_manager = MagicMock()
-    worker_manager.worker_summary.return_value = {
-        "total": 2,
-        "ready": 2,
-        "starting": 0,
-        "crashed": 0,
-    }
-    app = create_app(worker_manager=worker_manager)
-
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
+async def test_health_returns_ok_when_all_workers_ready(
+    client_factory: ClientFactory,
+) -> None:
+    worker_manager = SimpleNamespace(
+        worker_summary=lambda: {"total": 2, "ready": 2, "starting": 0, "crashed": 0},
+    )
+
+    async with client_factory(worker_manager=worker_manager) as client:
         response = await client.get("/health")
 
     body = response.json()
@@ -68,20 +91,14 @@ async def test_health_returns_ok_when_all_workers_ready() -> None:
     assert body["workers_total"] == 2
 
 
-async def test_health_returns_loading_when_workers_still_starting() -> None:
-    worker_manager = MagicMock()
-    worker_manager.worker_summary.return_value = {
-        "total": 2,
-        "ready": 1,
-        "starting": 1,
-        "crashed": 0,
-    }
-    app = create_app(worker_manager=worker_manager)
-
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
+async def test_health_returns_loading_when_workers_still_starting(
+    client_factory: ClientFactory,
+) -> None:
+    worker_manager = SimpleNamespace(
+        worker_summary=lambda: {"total": 2, "ready": 1, "starting": 1, "crashed": 0},
+    )
+
+    async with client_factory(worker_manager=worker_manager) as client:
         response = await client.get("/health")
 
     body = response.json()
@@ -90,20 +107,14 @@ async def test_health_returns_loading_when_workers_still_starting() -> None:
     assert body["workers_total"] == 2
 
 
-async def test_health_returns_degraded_when_worker_crashed() -> None:
-    worker_manager = MagicMock()
-    worker_manager.worker_summary.return_value = {
-        "total": 2,
-        "ready": 1,
-        "starting": 0,
-        "crashed": 1,
-    }
-    app = create_app(worker_manager=worker_manager)
-
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
+async def test_health_returns_degraded_when_worker_crashed(
+    client_factory: ClientFactory,
+) -> None:
+    worker_manager = SimpleNamespace(
+        worker_summary=lambda: {"total": 2, "ready": 1, "starting": 0, "crashed": 1},
+    )
+
+    async with client_factory(worker_manager=worker_manager) as client:
         response = await client.get("/health")
 
     body = response.json()
@@ -121,15 +132,13 @@ async def test_app_state_stores_registry_and_scheduler() -> None:
 # ─── Request ID Middleware (L-46) ───
 
 
-async def test_request_id_middleware_sets_request_state() -> None:
+async def test_request_id_middleware_sets_request_state(
+    client_factory: ClientFactory,
+) -> None:
     """RequestIDMiddleware sets a UUID on request.state.request_id for each request."""
-    app = create_app()
     ids: list[str] = []
 
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
+    async with client_factory() as client:
         for _ in range(3):
             response = await client.get("/health")
             assert response.status_code == 200
@@ -144,20 +153,12 @@ async def test_request_id_middleware_sets_request_state() -> None:
 # ─── /v1/models OpenAI format (M-13) ───
 
 
-async def test_list_models_returns_openai_format() -> None:
+async def test_list_models_returns_openai_format(client_factory: ClientFactory) -> None:
     """GET /v1/models returns OpenAI-compatible format with object: list."""
-    registry = MagicMock()
-    m1 = MagicMock()
-    m1.name = "faster-whisper-tiny"
-    m2 = MagicMock()
-    m2.name = "kokoro-v1"
-    registry.list_models.return_value = [m1, m2]
-
-    app = create_app(registry=registry)
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
+    manifests = [SimpleNamespace(name="faster-whisper-tiny"), SimpleNamespace(name="kokoro-v1")]
+    registry = SimpleNamespace(list_models=lambda: manifests)
+
+    async with client_factory(registry=registry) as client:
         response = await client.get("/v1/models")
 
     assert response.status_code == 200
@@ -170,13 +171,9 @@ async def test_list_models_returns_openai_format() -> None:
     assert body["data"][1]["id"] == "kokoro-v1"
 
 
-async def test_list_models_empty_when_no_registry() -> None:
+async def test_list_models_empty_when_no_registry(client_factory: ClientFactory) -> None:
     """GET /v1/models returns empty list when registry is None."""
-    app = create_app(registry=None)
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
+    async with client_factory(registry=None) as client:
         response = await client.get("/v1/models")
 
     assert response.status_code == 200
@@ -7,7 +7,7 @@ Segue o mesmo padrao dos testes de STT backend.
 from __future__ import annotations
 
 import os
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -211,8 +211,6 @@ class TestLoad:
             kokoro_mod.kokoro_lib = original  # type: ignore[assignment]
 
     async def test_load_with_auto_device(self, tmp_path: object) -> None:
-        from unittest.mock import patch
-
         mock_kokoro = _make_mock_kokoro_lib()
         model_dir = _make_model_dir(tmp_path)
 
@@ -249,6 +247,72 @@ class TestLoad:
         finally:
             kokoro_mod.kokoro_lib = original  # type: ignore[assignment]
 
+    async def test_load_torch_compile_disabled_by_default(self, tmp_path: object) -> None:
+        mock_kokoro = _make_mock_kokoro_lib()
+        model_dir = _make_model_dir(tmp_path)
+
+        import macaw.workers.tts.kokoro as kokoro_mod
+
+        original = kokoro_mod.kokoro_lib
+        kokoro_mod.kokoro_lib = mock_kokoro  # type: ignore[assignment]
+        try:
+            backend = KokoroBackend()
+            with patch.object(kokoro_mod, "configure_compile_cache") as mock_cache:
+                await backend.load(model_dir, {"device": "cpu"})
+            mock_kokoro.KModel.return_value.compile.assert_not_called()
+            mock_cache.assert_not_called()
+        finally:
+            kokoro_mod.kokoro_lib = original  # type: ignore[assignment]
+
+    async def test_load_torch_compile_compiles_model(self, tmp_path: object) -> None:
+        mock_kokoro = _make_mock_kokoro_lib()
+        model_dir = _make_model_dir(tmp_path)
+
+        import macaw.workers.tts.kokoro as kokoro_mod
+
+        original = kokoro_mod.kokoro_lib
+        kokoro_mod.kokoro_lib = mock_kokoro  # type: ignore[assignment]
+        try:
+            backend = KokoroBackend()
+            with patch.object(kokoro_mod, "configure_compile_cache") as mock_cache:
+                await backend.load(model_dir, {"device": "cpu", "torch_compile": True})
+            mock_kokoro.KModel.return_value.compile.assert_called_once_with(dynamic=None)
+            mock_cache.assert_called_once_with("kokoro", model_dir, "cpu")
+        finally:
+            kokoro_mod.kokoro_lib = original  # type: ignore[assignment]
+
+    async def test_load_chunk_ms_sets_chunk_size(self, tmp_path: object) -> None:
+        mock_kokoro = _make_mock_kokoro_lib()
+        model_dir = _make_model_dir(tmp_path)
+
+        import macaw.workers.tts.kokoro as kokoro_mod
+
+        original = kokoro_mod.kokoro_lib
+        kokoro_mod.kokoro_lib = mock_kokoro  # type: ignore[assignment]
+        try:
+            backend = KokoroBackend()
+            await backend.load(model_dir, {"device": "cpu", "chunk_ms": 50})
+            # 50ms at 24kHz = 1200 samples * 2 bytes
+            assert backend._chunk_bytes == 2400
+        finally:
+            kokoro_mod.kokoro_lib = original  # type: ignore[assignment]
+
+    async def test_load_non_positive_chunk_ms_raises(self, tmp_path: object) -> None:
+        mock_kokoro = _make_mock_kokoro_lib()
+        model_dir = _make_model_dir(tmp_path)
+
+        import macaw.workers.tts.kokoro as kokoro_mod
+
+        original = kokoro_mod.kokoro_lib
+        kokoro_mod.kokoro_lib = mock_kokoro  # type: ignore[assignment]
+        try:
+            backend = KokoroBackend()
+            with pytest.raises(ModelLoadError, match="chunk_ms must be positive"):
+                await backend.load(model_dir, {"device": "cpu", "chunk_ms": -10})
+            mock_kokoro.KModel.assert_not_called()
+        finally:
+            kokoro_mod.kokoro_lib = original  # type: ignore[assignment]
+
 
 class TestSynthesize:
     def _make_loaded_backend(
@@ -289,12 +353,12 @@ class TestSynthesize:
         async for chunk in backend.synthesize("Long text"):
             chunks.append(chunk)
 
-        # Every chunk except possibly the last should be exactly 4096 bytes
+        # Every chunk except possibly the last should be exactly 100ms (4800 bytes)
         for chunk in chunks[:-1]:
-            assert len(chunk) == 4096
+            assert len(chunk) == 4800
 
         # Last chunk may be smaller
-        assert len(chunks[-1]) <= 4096
+        assert len(chunks[-1]) <= 4800
 
     async def test_empty_text_raises_synthesis_error(self) -> None:
         backend = self._make_loaded_backend()
@@ -398,6 +462,22 @@ class TestSynthesize:
         total_bytes = sum(len(c) for c in chunks)
         assert total_bytes == (1200 + 1200) * 2
 
+    async def test_segment_tail_flushed_per_segment(self) -> None:
+        """Resto de cada frase e enviado antes da proxima frase ser sintetizada."""
+        backend = self._make_loaded_backend()
+        audio1 = np.full(3000, 0.25, dtype=np.float32)
+        audio2 = np.linspace(-1.0, 1.0, 6000, dtype=np.float32)
+        backend._pipeline.return_value = [  # type: ignore[attr-defined]
+            (None, None, audio1),
+            (None, None, audio2),
+        ]
+
+        chunks = [chunk async for chunk in backend.synthesize("Short then long")]
+
+        assert [len(c) for c in chunks] == [4800, 1200, 4800, 4800, 2400]
+        expected = float32_to_pcm16_bytes(audio1) + float32_to_pcm16_bytes(audio2)
+        assert b"".join(chunks) == expected
+
 
 class TestVoices:
     async def test_returns_voice_info_list_with_dir(self, tmp_path: object) -> None:
@@ -657,3 +737,8 @@ class TestFloat32ToPcm16Bytes:
         values = np.frombuffer(result, dtype=np.int16)
         assert values[0] == 32767
         assert values[1] == -32768
+
+    def test_does_not_mutate_input(self) -> None:
+        audio = np.array([0.5, 2.0], dtype=np.float32)
+        float32_to_pcm16_bytes(audio)
+        np.testing.assert_array_equal(audio, np.array([0.5, 2.0], dtype=np.float32))
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 
+import pytest
 import structlog
 
 import macaw.logging as macaw_logging
@@ -100,3 +101,87 @@ class TestConfigureLogging:
         assert parsed["key"] == "value"
 
         root.removeHandler(capture_handler)
+
+
+class TestJsonSerializer:
+    def setup_method(self) -> None:
+        _reset_logging()
+
+    def teardown_method(self) -> None:
+        _reset_logging()
+
+    def test_orjson_dumps_returns_str(self) -> None:
+        if not macaw_logging.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+
+        rendered = macaw_logging._orjson_dumps({"event": "ok", "n": 1})
+        assert isinstance(rendered, str)
+        assert json.loads(rendered) == {"event": "ok", "n": 1}
+
+    def test_orjson_dumps_uses_default_fallback(self) -> None:
+        if not macaw_logging.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+
+        class Opaque:
+            def __repr__(self) -> str:
+                return "<opaque>"
+
+        rendered = macaw_logging._orjson_dumps({"obj": Opaque()}, default=repr)
+        assert json.loads(rendered) == {"obj": "<opaque>"}
+
+    def test_orjson_dumps_falls_back_to_stdlib(self) -> None:
+        if not macaw_logging.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+
+        rendered = macaw_logging._orjson_dumps({"big": 2**70})
+        assert json.loads(rendered) == {"big": 2**70}
+
+    def test_json_format_renders_non_str_keys_and_big_ints(self) -> None:
+        import logging
+
+        macaw_logging.configure_logging(log_format="json", level="DEBUG")
+
+        root = logging.getLogger()
+        captured_records: list[str] = []
+
+        class CaptureHandler(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                captured_records.append(self.format(record))
+
+        capture_handler = CaptureHandler()
+        capture_handler.setFormatter(root.handlers[0].formatter)
+        root.addHandler(capture_handler)
+        try:
+            macaw_logging.get_logger("keys").info("mixed", mapping={0: "a"}, big=2**70)
+        finally:
+            root.removeHandler(capture_handler)
+
+        parsed = json.loads(captured_records[-1])
+        assert parsed["mapping"] == {"0": "a"}
+        assert parsed["big"] == 2**70
+
+    def test_json_format_without_orjson(self) -> None:
+        import logging
+        from unittest.mock import patch
+
+        with patch.object(macaw_logging, "HAS_ORJSON", False):
+            macaw_logging.configure_logging(log_format="json", level="DEBUG")
+
+        root = logging.getLogger()
+        captured_records: list[str] = []
+
+        class CaptureHandler(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                captured_records.append(self.format(record))
+
+        capture_handler = CaptureHandler()
+        capture_handler.setFormatter(root.handlers[0].formatter)
+        root.addHandler(capture_handler)
+        try:
+            macaw_logging.get_logger("fallback").info("stdlib json", key="value")
+        finally:
+            root.removeHandler(capture_handler)
+
+        parsed = json.loads(captured_records[-1])
+        assert parsed["event"] == "stdlib json"
+        assert parsed["key"] == "value"
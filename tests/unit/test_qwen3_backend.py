@@ -116,6 +116,18 @@ class TestLoad:
         finally:
             qwen3_mod._Qwen3TTSModel = original_cls  # type: ignore[assignment]
 
+    async def test_load_non_positive_chunk_ms_raises(self) -> None:
+        import macaw.workers.tts.qwen3 as qwen3_mod
+
+        original_cls = qwen3_mod._Qwen3TTSModel
+        qwen3_mod._Qwen3TTSModel = MagicMock()  # type: ignore[assignment]
+        try:
+            backend = Qwen3TTSBackend()
+            with pytest.raises(ModelLoadError, match="chunk_ms must be positive"):
+                await backend.load("/models/qwen3-tts", {"chunk_ms": 0})
+        finally:
+            qwen3_mod._Qwen3TTSModel = original_cls  # type: ignore[assignment]
+
     async def test_load_stores_default_voice(self) -> None:
         mock_model = _make_mock_qwen3_model()
 
@@ -333,8 +345,8 @@ class TestSynthesize:
         async for chunk in backend.synthesize("Long text"):
             chunks.append(chunk)
         for chunk in chunks[:-1]:
-            assert len(chunk) == 4096
-        assert len(chunks[-1]) <= 4096
+            assert len(chunk) == 4800
+        assert len(chunks[-1]) <= 4800
 
     async def test_default_voice_resolved(self) -> None:
         backend = self._make_loaded_backend()
@@ -1,14 +1,44 @@
-"""Tests for shared torch_utils functions: resolve_device() and release_gpu_memory().
+"""Tests for shared torch_utils functions.
 
-These are shared utilities used by all STT/TTS backends for device
-resolution and GPU memory cleanup.
+Covers resolve_device(), release_gpu_memory(), configure_jit_executor(),
+configure_torch_threads(), configure_compile_cache() and
+compile_for_inference() — shared utilities used by all STT/TTS backends for
+device resolution, GPU memory cleanup, TorchScript executor selection, CPU
+thread sizing and torch.compile caching.
 """
 
 from __future__ import annotations
 
+import os
 from unittest.mock import MagicMock, patch
 
-from macaw.workers.torch_utils import release_gpu_memory, resolve_device
+from macaw.workers.torch_utils import (
+    compile_for_inference,
+    configure_compile_cache,
+    configure_jit_executor,
+    configure_torch_threads,
+    release_gpu_memory,
+    resolve_device,
+)
+
+_COMPILE_CACHE_ENV_VARS = (
+    "MACAW_COMPILE_CACHE_DIR",
+    "TORCHINDUCTOR_CACHE_DIR",
+    "TRITON_CACHE_DIR",
+    "TORCHINDUCTOR_FX_GRAPH_CACHE",
+)
+
+
+def _env_without_compile_cache() -> dict[str, str]:
+    return {k: v for k, v in os.environ.items() if k not in _COMPILE_CACHE_ENV_VARS}
+
+
+def _mock_torch(*, cuda: bool = True, version: str = "2.5.0") -> MagicMock:
+    mock_torch = MagicMock()
+    mock_torch.__version__ = version
+    mock_torch.cuda.is_available.return_value = cuda
+    mock_torch.cuda.get_device_capability.return_value = (8, 9)
+    return mock_torch
 
 
 class TestResolveDevice:
@@ -88,3 +118,149 @@ class TestReleaseGpuMemory:
             release_gpu_memory()
             release_gpu_memory()
         assert mock_torch.cuda.empty_cache.call_count == 2
+
+
+class TestConfigureJitExecutor:
+    """configure_jit_executor() turns off the TorchScript profiling executor."""
+
+    def test_disabled_by_default(self) -> None:
+        mock_torch = MagicMock()
+        env = {k: v for k, v in os.environ.items() if k != "MACAW_DISABLE_JIT_PROFILING"}
+        with (
+            patch.dict(os.environ, env, clear=True),
+            patch.dict("sys.modules", {"torch": mock_torch}),
+        ):
+            assert configure_jit_executor() is False
+        mock_torch._C._jit_set_profiling_executor.assert_not_called()
+
+    def test_opt_in_via_env(self) -> None:
+        mock_torch = MagicMock()
+        with (
+            patch.dict(os.environ, {"MACAW_DISABLE_JIT_PROFILING": "1"}),
+            patch.dict("sys.modules", {"torch": mock_torch}),
+        ):
+            assert configure_jit_executor() is True
+        mock_torch._C._jit_set_profiling_executor.assert_called_once_with(False)
+        mock_torch._C._jit_set_profiling_mode.assert_called_once_with(False)
+        mock_torch._C._get_graph_executor_optimize.assert_called_once_with(False)
+
+    def test_skips_missing_hooks(self) -> None:
+        """Builds without some private hooks are tolerated."""
+        mock_torch = MagicMock()
+        mock_torch._C = MagicMock(spec=["_jit_set_profiling_executor"])
+        with (
+            patch.dict(os.environ, {"MACAW_DISABLE_JIT_PROFILING": "1"}),
+            patch.dict("sys.modules", {"torch": mock_torch}),
+        ):
+            assert configure_jit_executor() is True
+        mock_torch._C._jit_set_profiling_executor.assert_called_once_with(False)
+
+    def test_survives_missing_torch(self) -> None:
+        with (
+            patch.dict(os.environ, {"MACAW_DISABLE_JIT_PROFILING": "1"}),
+            patch.dict("sys.modules", {"torch": None}),
+        ):
+            assert configure_jit_executor() is False
+
+
+class TestConfigureTorchThreads:
+    """configure_torch_threads() sizes torch's intra-op thread pool."""
+
+    def test_sets_num_threads(self) -> None:
+        mock_torch = MagicMock()
+        with patch.dict("sys.modules", {"torch": mock_torch}):
+            configure_torch_threads(6)
+        mock_torch.set_num_threads.assert_called_once_with(6)
+
+    def test_survives_missing_torch(self) -> None:
+        with patch.dict("sys.modules", {"torch": None}):
+            configure_torch_threads(6)
+
+
+class TestConfigureCompileCache:
+    """configure_compile_cache() sets per-model Inductor/Triton cache dirs."""
+
+    def test_returns_none_without_torch(self) -> None:
+        with patch.dict("sys.modules", {"torch": None}):
+            assert configure_compile_cache("kokoro", "/models/kokoro", "cuda:0") is None
+
+    def test_sets_cache_dirs_under_base_dir(self, tmp_path: object) -> None:
+        env = _env_without_compile_cache()
+        env["MACAW_COMPILE_CACHE_DIR"] = str(tmp_path)
+        with (
+            patch.dict(os.environ, env, clear=True),
+            patch.dict("sys.modules", {"torch": _mock_torch()}),
+        ):
+            key = configure_compile_cache("kokoro", "/models/kokoro", "cuda:0")
+            assert key is not None
+            assert os.environ["TORCHINDUCTOR_CACHE_DIR"] == os.path.join(
+                str(tmp_path), "inductor", key
+            )
+            assert os.environ["TRITON_CACHE_DIR"] == os.path.join(str(tmp_path), "triton", key)
+            assert os.environ["TORCHINDUCTOR_FX_GRAPH_CACHE"] == "1"
+
+    def test_key_is_stable(self) -> None:
+        with (
+            patch.dict(os.environ, _env_without_compile_cache(), clear=True),
+            patch.dict("sys.modules", {"torch": _mock_torch()}),
+        ):
+            first = configure_compile_cache("kokoro", "/models/kokoro", "cuda:0")
+            second = configure_compile_cache("kokoro", "/models/kokoro", "cuda:0")
+        assert first == second
+
+    def test_key_changes_with_model_and_torch_version(self) -> None:
+        with patch.dict(os.environ, _env_without_compile_cache(), clear=True):
+            with patch.dict("sys.modules", {"torch": _mock_torch()}):
+                base = configure_compile_cache("kokoro", "/models/kokoro", "cuda:0")
+                other_model = configure_compile_cache("kokoro", "/models/other", "cuda:0")
+            with patch.dict("sys.modules", {"torch": _mock_torch(version="2.6.0")}):
+                other_torch = configure_compile_cache("kokoro", "/models/kokoro", "cuda:0")
+        assert len({base, other_model, other_torch}) == 3
+
+    def test_cpu_device_does_not_probe_cuda(self) -> None:
+        """A cpu worker on a CUDA host must not trigger CUDA lazy init."""
+        mock_torch = _mock_torch(cuda=True)
+        with (
+            patch.dict(os.environ, _env_without_compile_cache(), clear=True),
+            patch.dict("sys.modules", {"torch": mock_torch}),
+        ):
+            cpu_key = configure_compile_cache("kokoro", "/models/kokoro", "cpu")
+            gpu_key = configure_compile_cache("kokoro", "/models/kokoro", "cuda:0")
+        assert cpu_key != gpu_key
+        mock_torch.cuda.get_device_capability.assert_called_once_with("cuda:0")
+
+    def test_capability_from_configured_device(self) -> None:
+        mock_torch = _mock_torch()
+        with (
+            patch.dict(os.environ, _env_without_compile_cache(), clear=True),
+            patch.dict("sys.modules", {"torch": mock_torch}),
+        ):
+            configure_compile_cache("kokoro", "/models/kokoro", "cuda:1")
+        mock_torch.cuda.get_device_capability.assert_called_once_with("cuda:1")
+
+    def test_respects_existing_env(self) -> None:
+        env = _env_without_compile_cache()
+        env["TORCHINDUCTOR_CACHE_DIR"] = "/custom/inductor"
+        with (
+            patch.dict(os.environ, env, clear=True),
+            patch.dict("sys.modules", {"torch": _mock_torch()}),
+        ):
+            configure_compile_cache("kokoro", "/models/kokoro", "cuda:0")
+            assert os.environ["TORCHINDUCTOR_CACHE_DIR"] == "/custom/inductor"
+
+
+class TestCompileForInference:
+    """compile_for_inference() compiles modules in place, failing open."""
+
+    def test_compiles_with_automatic_dynamic_shapes(self) -> None:
+        module = MagicMock()
+        assert compile_for_inference(module) is True
+        module.compile.assert_called_once_with(dynamic=None)
+
+    def test_returns_false_without_compile_method(self) -> None:
+        assert compile_for_inference(object()) is False
+
+    def test_survives_compile_error(self) -> None:
+        module = MagicMock()
+        module.compile.side_effect = RuntimeError("inductor unavailable")
+        assert compile_for_inference(module) is False
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import grpc
 import pytest
@@ -268,6 +269,34 @@ class TestSynthesizeErrors:
 
         ctx.abort.assert_called_once_with(grpc.StatusCode.INTERNAL, "GPU OOM")
 
+    async def test_not_ready_aborts_unavailable(self) -> None:
+        """Durante o warmup, Synthesize aborta com UNAVAILABLE."""
+        servicer = TTSWorkerServicer(
+            backend=MockTTSBackend(),  # type: ignore[arg-type]
+            model_name="kokoro-v1",
+            engine="kokoro",
+            ready=asyncio.Event(),
+        )
+        request = SynthesizeRequest(
+            request_id="req-warmup-1",
+            text="Ola mundo",
+            voice="default",
+            sample_rate=24000,
+            speed=1.0,
+        )
+        ctx = _make_context()
+        ctx.abort = AsyncMock(
+            side_effect=grpc.aio.AbortError(  # type: ignore[attr-defined]
+                grpc.StatusCode.UNAVAILABLE, "Worker is warming up"
+            )
+        )
+
+        with pytest.raises(grpc.aio.AbortError):  # type: ignore[attr-defined]
+            async for _chunk in servicer.Synthesize(request, ctx):
+                pass  # pragma: no cover
+
+        ctx.abort.assert_called_once_with(grpc.StatusCode.UNAVAILABLE, "Worker is warming up")
+
     async def test_cancelled_context_stops_streaming(self) -> None:
         """Se context cancelado, para de enviar chunks."""
         # Backend que produz muitos chunks
@@ -335,6 +364,33 @@ class TestHealth:
         response = await servicer.Health(HealthRequest(), ctx)
         assert response.status == "not_loaded"
 
+    async def test_returns_loading_while_warming_up(self) -> None:
+        """Health retorna loading enquanto o evento ready nao foi setado."""
+        servicer = TTSWorkerServicer(
+            backend=MockTTSBackend(),  # type: ignore[arg-type]
+            model_name="kokoro-v1",
+            engine="kokoro",
+            ready=asyncio.Event(),
+        )
+        ctx = _make_context()
+        response = await servicer.Health(HealthRequest(), ctx)
+        assert response.status == "loading"
+        assert response.model_name == "kokoro-v1"
+
+    async def test_returns_ok_after_ready(self) -> None:
+        """Health delega ao backend apos o evento ready ser setado."""
+        ready = asyncio.Event()
+        servicer = TTSWorkerServicer(
+            backend=MockTTSBackend(),  # type: ignore[arg-type]
+            model_name="kokoro-v1",
+            engine="kokoro",
+            ready=ready,
+        )
+        ready.set()
+        ctx = _make_context()
+        response = await servicer.Health(HealthRequest(), ctx)
+        assert response.status == "ok"
+
     async def test_returns_model_name_and_engine(self) -> None:
         """Health retorna nome do modelo e engine."""
         servicer = TTSWorkerServicer(
@@ -532,11 +588,199 @@ class TestCreateBackend:
         assert isinstance(backend, Qwen3TTSBackend)
 
 
+class TestPreloadEngineModule:
+    def test_preload_imports_engine_module(self) -> None:
+        """Preload importa o modulo da engine em background."""
+        from macaw.workers.tts.main import _preload_engine_module
+
+        future = _preload_engine_module("kokoro")
+        assert future is not None
+        module = future.result(timeout=30)
+        assert module.__name__ == "macaw.workers.tts.kokoro"
+
+    def test_unknown_engine_returns_none(self) -> None:
+        """Engine desconhecida nao dispara preload."""
+        from macaw.workers.tts.main import _preload_engine_module
+
+        assert _preload_engine_module("nonexistent") is None
+
+    def test_create_backend_uses_preloaded_module(self) -> None:
+        """_create_backend instancia a classe do modulo ja importado pelo preload."""
+        from macaw.workers.tts.main import _create_backend, _preload_engine_module
+
+        future = _preload_engine_module("kokoro")
+        assert future is not None
+        module = future.result(timeout=30)
+
+        backend = _create_backend("kokoro")
+        assert type(backend) is module.KokoroBackend
+
+
+# ===================================================================
+# Testes do executor de inferencia e opcoes do server gRPC
+# ===================================================================
+
+
+class TestInferenceExecutor:
+    def test_default_size_is_twice_cpu_count(self) -> None:
+        """Sem configuracao, o pool tem 2x o numero de CPUs."""
+        import os
+
+        from macaw.workers.tts.main import _create_inference_executor
+
+        executor = _create_inference_executor({})
+        try:
+            assert executor._max_workers == (os.cpu_count() or 1) * 2
+        finally:
+            executor.shutdown(wait=False)
+
+    def test_size_from_engine_config(self) -> None:
+        """inference_workers no engine_config define o tamanho do pool."""
+        from macaw.workers.tts.main import _create_inference_executor
+
+        executor = _create_inference_executor({"inference_workers": 3})
+        try:
+            assert executor._max_workers == 3
+        finally:
+            executor.shutdown(wait=False)
+
+    def test_pins_threads_to_given_cpus(self) -> None:
+        """Com cpus, cada thread do pool e fixada nesses cores."""
+        from macaw.workers.tts.main import _create_inference_executor
+
+        with patch("os.sched_setaffinity") as mock_setaffinity:
+            executor = _create_inference_executor({"inference_workers": 1}, cpus={2, 3})
+            try:
+                executor.submit(lambda: None).result()
+            finally:
+                executor.shutdown(wait=True)
+
+        mock_setaffinity.assert_called_once_with(0, {2, 3})
+
+    def test_default_size_counts_only_pinned_cpus(self) -> None:
+        """Com cpus, o tamanho padrao e uma thread por core fixado."""
+        from macaw.workers.tts.main import _create_inference_executor
+
+        executor = _create_inference_executor({}, cpus={2, 3})
+        try:
+            assert executor._max_workers == 2
+        finally:
+            executor.shutdown(wait=False)
+
+    def test_server_options_bound_concurrent_streams(self) -> None:
+        """Opcoes do server limitam streams concorrentes e nao limitam pings sem dados."""
+        from macaw.workers.tts.main import _GRPC_SERVER_OPTIONS, GRPC_MAX_CONCURRENT_STREAMS
+
+        options = dict(_GRPC_SERVER_OPTIONS)
+        assert options["grpc.max_concurrent_streams"] == GRPC_MAX_CONCURRENT_STREAMS
+        assert options["grpc.http2.max_pings_without_data"] == 0
+
+    def test_server_keepalive_compatible_with_runtime_channel(self) -> None:
+        """Keepalive do canal do runtime respeita o intervalo minimo aceito pelo worker."""
+        from macaw.server.constants import TTS_GRPC_CHANNEL_OPTIONS
+        from macaw.workers.tts.main import _GRPC_SERVER_OPTIONS
+
+        server = dict(_GRPC_SERVER_OPTIONS)
+        client = dict(TTS_GRPC_CHANNEL_OPTIONS)
+        assert server["grpc.keepalive_time_ms"] == 30_000
+        assert server["grpc.keepalive_permit_without_calls"] == 1
+        assert (
+            client["grpc.keepalive_time_ms"]
+            >= server["grpc.http2.min_recv_ping_interval_without_data_ms"]
+        )
+
+
+class TestResolveCpuPartition:
+    def test_disabled_by_default(self) -> None:
+        """Sem io_cpus, nenhuma afinidade e configurada."""
+        from macaw.workers.tts.main import _resolve_cpu_partition
+
+        assert _resolve_cpu_partition({}) is None
+
+    def test_splits_available_cpus(self) -> None:
+        """io_cpus vai para o loop/gRPC; o restante para inferencia."""
+        from macaw.workers.tts.main import _resolve_cpu_partition
+
+        with patch("os.sched_getaffinity", return_value={0, 1, 2, 3}):
+            result = _resolve_cpu_partition({"io_cpus": [0, 1]})
+
+        assert result == ({0, 1}, {2, 3})
+
+    def test_ignores_unavailable_cpus(self) -> None:
+        """Cores fora da afinidade do processo sao descartados."""
+        from macaw.workers.tts.main import _resolve_cpu_partition
+
+        with patch("os.sched_getaffinity", return_value={0, 1, 2, 3}):
+            result = _resolve_cpu_partition({"io_cpus": [0, 9]})
+
+        assert result == ({0}, {1, 2, 3})
+
+    def test_none_when_no_cpu_left_for_inference(self) -> None:
+        """Se io_cpus cobre todos os cores, a configuracao e ignorada."""
+        from macaw.workers.tts.main import _resolve_cpu_partition
+
+        with patch("os.sched_getaffinity", return_value={0, 1}):
+            assert _resolve_cpu_partition({"io_cpus": [0, 1]}) is None
+
+    def test_none_when_invalid(self) -> None:
+        from macaw.workers.tts.main import _resolve_cpu_partition
+
+        assert _resolve_cpu_partition({"io_cpus": ["a"]}) is None
+
+
 # ===================================================================
 # Testes do parse_args
 # ===================================================================
 
 
+class TestParseEngineConfig:
+    def test_parses_json_object(self) -> None:
+        """engine_config JSON e convertido em dict."""
+        from macaw.workers.tts.main import _parse_engine_config
+
+        config = _parse_engine_config('{"device": "cuda", "warmup_lengths": [8, 32]}')
+        assert config == {"device": "cuda", "warmup_lengths": [8, 32]}
+
+    def test_falls_back_to_stdlib_json(self) -> None:
+        """Sem orjson instalado, usa json da stdlib."""
+        from unittest.mock import patch
+
+        from macaw.workers.tts.main import _parse_engine_config
+
+        with patch.dict("sys.modules", {"orjson": None}):
+            assert _parse_engine_config('{"device": "cpu"}') == {"device": "cpu"}
+
+
+class TestRunEventLoop:
+    def test_runs_on_uvloop_when_installed(self) -> None:
+        """Com uvloop instalado, o worker roda no loop do uvloop."""
+        uvloop = pytest.importorskip("uvloop")
+        from macaw.workers.tts.main import _run_event_loop
+
+        loops: list[object] = []
+
+        async def _capture() -> None:
+            loops.append(asyncio.get_running_loop())
+
+        _run_event_loop(_capture())
+        assert isinstance(loops[0], uvloop.Loop)
+
+    def test_falls_back_to_asyncio_without_uvloop(self) -> None:
+        """Sem uvloop, usa o loop padrao do asyncio."""
+        from unittest.mock import patch
+
+        from macaw.workers.tts.main import _run_event_loop
+
+        loops: list[object] = []
+
+        async def _capture() -> None:
+            loops.append(asyncio.get_running_loop())
+
+        with patch.dict("sys.modules", {"uvloop": None}):
+            _run_event_loop(_capture())
+        assert type(loops[0]).__module__.startswith("asyncio")
+
+
 class TestParseArgs:
     def test_default_values(self) -> None:
         """Argumentos default sao corretos."""
@@ -128,3 +128,21 @@ class TestEngineCapabilities:
         )
         assert caps.supports_hot_words is True
         assert caps.max_concurrent_sessions == 4
+
+
+class TestResultTypesLayout:
+    """Result types are built per word/segment on the hot path — keep them slotted."""
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            WordTimestamp(word="ola", start=0.0, end=0.5),
+            SegmentDetail(id=0, start=0.0, end=1.5, text="ola mundo"),
+            TranscriptSegment(text="ola", is_final=True, segment_id=0),
+            BatchResult(text="ola", language="pt", duration=0.5, segments=()),
+        ],
+        ids=lambda obj: type(obj).__name__,
+    )
+    def test_slotted_and_frozen(self, instance: object) -> None:
+        assert not hasattr(instance, "__dict__")
+        assert type(instance).__dataclass_params__.frozen  # type: ignore[attr-defined]
@@ -313,3 +313,129 @@ class TestTTSWarmup:
 
         await _warmup_backend(mock_backend, warmup_steps=3)
         assert call_count == 2
+
+    async def test_warmup_drains_full_stream(self) -> None:
+        from macaw.workers.tts.main import _warmup_backend
+
+        chunks_consumed = 0
+
+        async def _multi_chunk_synthesize(text: str, **kwargs: object):  # type: ignore[no-untyped-def]
+            nonlocal chunks_consumed
+            for _ in range(5):
+                chunks_consumed += 1
+                yield b"\x00" * 100
+
+        mock_backend = MagicMock()
+        mock_backend.synthesize = _multi_chunk_synthesize
+
+        await _warmup_backend(mock_backend, warmup_steps=2)
+        assert chunks_consumed == 10
+
+    async def test_warmup_uses_configured_texts(self) -> None:
+        from macaw.workers.tts.main import _resolve_warmup_texts, _warmup_backend
+
+        word_counts: list[int] = []
+
+        async def _tracking_synthesize(text: str, **kwargs: object):  # type: ignore[no-untyped-def]
+            word_counts.append(len(text.split()))
+            yield b"\x00" * 100
+
+        mock_backend = MagicMock()
+        mock_backend.synthesize = _tracking_synthesize
+
+        warmup_texts = _resolve_warmup_texts([8, 32, 128, 448])
+        await _warmup_backend(mock_backend, warmup_steps=4, warmup_texts=warmup_texts)
+
+        assert word_counts == [8, 32, 128, 448]
+
+    async def test_warmup_stops_on_timeout(self) -> None:
+        import asyncio
+
+        from macaw.workers.tts.main import _warmup_backend
+
+        call_count = 0
+
+        async def _hanging_synthesize(text: str, **kwargs: object):  # type: ignore[no-untyped-def]
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(10)
+            yield b"\x00" * 100
+
+        mock_backend = MagicMock()
+        mock_backend.synthesize = _hanging_synthesize
+
+        await _warmup_backend(mock_backend, warmup_steps=3, step_timeout_s=0.01)
+        assert call_count == 1
+
+
+class TestTTSWarmupLengths:
+    """_resolve_warmup_texts maps engine_config["warmup_lengths"] to warmup texts."""
+
+    def test_default_when_unset(self) -> None:
+        from macaw.workers.tts.main import _WARMUP_TEXTS, _resolve_warmup_texts
+
+        assert _resolve_warmup_texts(None) == _WARMUP_TEXTS
+
+    def test_default_when_empty(self) -> None:
+        from macaw.workers.tts.main import _WARMUP_TEXTS, _resolve_warmup_texts
+
+        assert _resolve_warmup_texts([]) == _WARMUP_TEXTS
+
+    def test_default_when_invalid(self) -> None:
+        from macaw.workers.tts.main import _WARMUP_TEXTS, _resolve_warmup_texts
+
+        assert _resolve_warmup_texts(["long"]) == _WARMUP_TEXTS
+        assert _resolve_warmup_texts("8,32") == _WARMUP_TEXTS
+
+    def test_non_positive_lengths_ignored(self) -> None:
+        from macaw.workers.tts.main import _resolve_warmup_texts
+
+        texts = _resolve_warmup_texts([0, 16])
+        assert len(texts) == 1
+        assert len(texts[0].split()) == 16
+
+
+class TestTTSBackgroundWarmup:
+    """_warmup_in_background signals readiness once warmup finishes."""
+
+    async def test_sets_ready_after_warmup(self) -> None:
+        import asyncio
+
+        from macaw.workers.tts.main import _WARMUP_TEXTS, _warmup_in_background
+
+        ready = asyncio.Event()
+        ready_during_synthesis: list[bool] = []
+
+        async def _tracking_synthesize(text: str, **kwargs: object):  # type: ignore[no-untyped-def]
+            ready_during_synthesis.append(ready.is_set())
+            yield b"\x00" * 100
+
+        mock_backend = MagicMock()
+        mock_backend.synthesize = _tracking_synthesize
+
+        await _warmup_in_background(
+            mock_backend, ready, warmup_steps=3, warmup_texts=_WARMUP_TEXTS
+        )
+
+        assert ready_during_synthesis == [False, False, False]
+        assert ready.is_set()
+
+    async def test_sets_ready_when_warmup_fails(self) -> None:
+        import asyncio
+
+        from macaw.workers.tts.main import _WARMUP_TEXTS, _warmup_in_background
+
+        async def _failing_synthesize(text: str, **kwargs: object):  # type: ignore[no-untyped-def]
+            msg = "Synthesis failed"
+            raise RuntimeError(msg)
+            yield b""  # pragma: no cover
+
+        mock_backend = MagicMock()
+        mock_backend.synthesize = _failing_synthesize
+
+        ready = asyncio.Event()
+        await _warmup_in_background(
+            mock_backend, ready, warmup_steps=3, warmup_texts=_WARMUP_TEXTS
+        )
+
+        assert ready.is_set()